@@ -15,17 +15,70 @@ import random
 from pathlib import Path
 
 import cv2
+import mss
 import numpy as np
+import pyotp
+from Xlib import X, XK
+from Xlib.display import Display
+from Xlib.ext import xtest
 
 # Configuration
 TEMPLATES_DIR = Path(__file__).parent / "templates"
-SCREENSHOT_PATH = "/tmp/screen.png"
+# Every template the login flow matches, preloaded before automation starts
+TEMPLATE_MANIFEST = [
+    "i_understand_button.png",
+    "login_button.png",
+    "cloudflare_human_checkbox.png",
+    "error_login_cant_open_page.png",
+    "login_authenticator_app_button.png",
+    "select_account_button.png",
+    "user_select_label.png",
+    "user_select_header.png",
+    "character_select_label.png",
+    "character_select_header.png",
+    "play_button.png",
+]
 MATCH_THRESHOLD = 0.8
-POLL_INTERVAL = 0.5  # seconds between checks
+# Polls start fast and back off exponentially: early appearances are caught
+# quickly while long waits don't spin the CPU
+POLL_INTERVAL_MIN = 0.1  # seconds before the first re-check
+POLL_INTERVAL_MAX = 1.0  # cap on seconds between checks
+POLL_BACKOFF = 1.5  # interval growth factor per poll
+
+# Coarse-to-fine matching: a half-resolution pass finds candidates, then
+# only small regions around them are matched at full resolution
+# (thin text loses up to ~0.35 of its score at half resolution)
+PYRAMID_SLACK = 0.25  # coarse scores may sit this far below the real threshold
+PYRAMID_MIN_SIDE = 32  # thinner templates (single text lines) skip the coarse pass
+PYRAMID_REFINE_MARGIN = 4  # px of slack around each coarse region at full res
+_PYRAMID_KERNEL = np.ones((3, 3), np.uint8)
+
+# Bolt's layout is fixed, so each template's last match location is kept
+# across runs and a small region around it is searched before the full screen
+LAST_LOC_PATH = Path.home() / ".cache" / "rocinante" / "last_locs.json"
+LAST_LOC_MARGIN = 50  # px searched around the remembered top-left corner
 
 # Global config dict (loaded from JSON file)
 CONFIG: dict = {}
 
+# Decoded grayscale templates keyed by file name: (template_gray, template_down, h, w)
+_TEMPLATE_CACHE: dict[str, tuple[np.ndarray, np.ndarray, int, int]] = {}
+
+# (screen, pyrDown of screen) for the most recent screenshot, shared by every
+# template matched against that same screenshot
+_SCREEN_DOWN: tuple[np.ndarray, np.ndarray] | None = None
+
+# Last match top-left per template ({name: [x, y]}), loaded from LAST_LOC_PATH
+# on first use
+_LAST_LOC_CACHE: dict[str, list[int]] | None = None
+
+# Screen grabber, opened on first screenshot (needs DISPLAY)
+_SCT = None
+
+# X connection used to inject mouse/keyboard input via XTEST, opened on first
+# use and kept for the whole run instead of forking xdotool per action
+_DISPLAY: Display | None = None
+
 
 class Colors:
     """ANSI color codes for logging."""
@@ -53,52 +106,179 @@ def log_step(msg: str):
 
 
 def take_screenshot() -> np.ndarray | None:
-    """Capture the current screen."""
+    """Capture the current screen as grayscale, straight from X into memory."""
+    global _SCT
     try:
-        result = subprocess.run(
-            ['import', '-window', 'root', SCREENSHOT_PATH],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            log_error(f"Screenshot failed: {result.stderr}")
-            return None
-        img = cv2.imread(SCREENSHOT_PATH)
-        if img is None:
-            log_error(f"Failed to load screenshot from {SCREENSHOT_PATH}")
-        return img
+        if _SCT is None:
+            _SCT = mss.mss()
+        shot = _SCT.grab(_SCT.monitors[1])
+        # mss hands back raw BGRA pixels; matching only ever uses grayscale,
+        # so convert once here rather than materializing a BGR copy first
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY)
     except Exception as e:
         log_error(f"Failed to take screenshot: {e}")
         return None
 
 
-def find_template(screen: np.ndarray, template_name: str, threshold: float = MATCH_THRESHOLD, return_bounds: bool = False) -> tuple[int, int] | tuple[int, int, int, int] | None:
+def load_template(template_name: str) -> tuple[np.ndarray, np.ndarray, int, int] | None:
     """
-    Find a template image on screen.
-    Returns (x, y) center coordinates if found, None otherwise.
-    If return_bounds=True, returns (x, y, width, height) of top-left corner + size.
+    Load a template as grayscale, memoized by name.
+    Returns (template_gray, template_down, height, width), where template_down
+    is the half-resolution pyramid level, or None if the file is missing/unreadable.
     """
+    cached = _TEMPLATE_CACHE.get(template_name)
+    if cached is not None:
+        return cached
+    
     template_path = TEMPLATES_DIR / template_name
     if not template_path.exists():
         log_error(f"Template not found: {template_path}")
         return None
     
-    template = cv2.imread(str(template_path))
-    if template is None:
+    # Only the grayscale version is ever matched against, so skip the BGR decode
+    template_gray = cv2.imread(str(template_path), cv2.IMREAD_GRAYSCALE)
+    if template_gray is None:
         log_error(f"Failed to load template image: {template_path}")
         return None
     
-    # Convert to grayscale for robust matching
-    screen_gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
-    template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
-    
+    h, w = template_gray.shape[:2]
+    _TEMPLATE_CACHE[template_name] = (template_gray, cv2.pyrDown(template_gray), h, w)
+    return _TEMPLATE_CACHE[template_name]
+
+
+def preload_templates():
+    """Decode every template in TEMPLATE_MANIFEST into the cache up front."""
+    loaded = sum(load_template(name) is not None for name in TEMPLATE_MANIFEST)
+    log_info(f"Preloaded {loaded}/{len(TEMPLATE_MANIFEST)} templates")
+
+
+def _screen_down(screen_gray: np.ndarray) -> np.ndarray:
+    """Half-resolution pyrDown of screen_gray, computed once per screenshot."""
+    global _SCREEN_DOWN
+    if _SCREEN_DOWN is None or _SCREEN_DOWN[0] is not screen_gray:
+        _SCREEN_DOWN = (screen_gray, cv2.pyrDown(screen_gray))
+    return _SCREEN_DOWN[1]
+
+
+def _match_full(screen_gray: np.ndarray, template_gray: np.ndarray) -> tuple[float, tuple[int, int]]:
+    """Best TM_CCOEFF_NORMED score and top-left location over the whole screen."""
     result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
     _, max_val, _, max_loc = cv2.minMaxLoc(result)
+    return max_val, max_loc
+
+
+def _match_pyramid(screen_gray: np.ndarray, template: tuple, threshold: float) -> tuple[float, tuple[int, int]]:
+    """
+    Best TM_CCOEFF_NORMED score and top-left location, searched coarse-to-fine.
+    The half-resolution pass covers 1/4 of the pixels; every blob above
+    (threshold - PYRAMID_SLACK) is then re-matched exactly at full resolution,
+    in a window only PYRAMID_REFINE_MARGIN px larger than the template.
+    If nothing clears the coarse cut, the coarse best score is returned.
+    """
+    template_gray, template_down, h, w = template
+    if min(h, w) < PYRAMID_MIN_SIDE:
+        return _match_full(screen_gray, template_gray)
+    
+    screen_down = _screen_down(screen_gray)
+    coarse = cv2.matchTemplate(screen_down, template_down, cv2.TM_CCOEFF_NORMED)
+    
+    # Close small gaps so neighbouring hits collapse into one region
+    hits = (coarse >= threshold - PYRAMID_SLACK).astype(np.uint8)
+    hits = cv2.morphologyEx(hits, cv2.MORPH_CLOSE, _PYRAMID_KERNEL)
+    count, _, stats, _ = cv2.connectedComponentsWithStats(hits)
+    
+    if count <= 1:
+        _, coarse_val, _, coarse_loc = cv2.minMaxLoc(coarse)
+        return coarse_val, (coarse_loc[0] * 2, coarse_loc[1] * 2)
+    
+    screen_h, screen_w = screen_gray.shape[:2]
+    margin = PYRAMID_REFINE_MARGIN
+    best_val, best_loc = -1.0, (0, 0)
+    for x, y, bw, bh, _ in stats[1:]:
+        # Range of full-res top-left positions to test, clamped to the screen
+        x1 = min(screen_w - w, 2 * (x + bw - 1) + margin)
+        y1 = min(screen_h - h, 2 * (y + bh - 1) + margin)
+        x0 = min(max(0, 2 * x - margin), x1)
+        y0 = min(max(0, 2 * y - margin), y1)
+        roi = screen_gray[y0:y1 + h, x0:x1 + w]
+        
+        result = cv2.matchTemplate(roi, template_gray, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        if max_val > best_val:
+            best_val, best_loc = max_val, (x0 + max_loc[0], y0 + max_loc[1])
+    
+    return best_val, best_loc
+
+
+def _last_location(template_name: str) -> list[int] | None:
+    """Remembered top-left [x, y] of a template's last match, if any."""
+    global _LAST_LOC_CACHE
+    if _LAST_LOC_CACHE is None:
+        try:
+            with open(LAST_LOC_PATH, 'r') as f:
+                _LAST_LOC_CACHE = json.load(f)
+        except (OSError, ValueError):
+            _LAST_LOC_CACHE = {}
+    return _LAST_LOC_CACHE.get(template_name)
+
+
+def _remember_location(template_name: str, loc: tuple[int, int]):
+    """Record a match location, persisting to LAST_LOC_PATH when it changed."""
+    loc = [int(loc[0]), int(loc[1])]
+    if _last_location(template_name) == loc:
+        return
+    _LAST_LOC_CACHE[template_name] = loc
+    try:
+        LAST_LOC_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(LAST_LOC_PATH, 'w') as f:
+            json.dump(_LAST_LOC_CACHE, f)
+    except OSError as e:
+        log_warn(f"Could not save template locations: {e}")
+
+
+def _match_last_location(screen_gray: np.ndarray, template_name: str, template: tuple) -> tuple[float, tuple[int, int]] | None:
+    """
+    Best TM_CCOEFF_NORMED score and top-left location within LAST_LOC_MARGIN
+    of where the template was last found, or None if it was never found.
+    """
+    loc = _last_location(template_name)
+    if loc is None:
+        return None
+    template_gray, _, h, w = template
+    screen_h, screen_w = screen_gray.shape[:2]
+    x0 = min(max(0, loc[0] - LAST_LOC_MARGIN), max(0, screen_w - w))
+    y0 = min(max(0, loc[1] - LAST_LOC_MARGIN), max(0, screen_h - h))
+    roi = screen_gray[y0:loc[1] + LAST_LOC_MARGIN + h, x0:loc[0] + LAST_LOC_MARGIN + w]
+    if roi.shape[0] < h or roi.shape[1] < w:
+        return None
+    
+    result = cv2.matchTemplate(roi, template_gray, cv2.TM_CCOEFF_NORMED)
+    _, max_val, _, max_loc = cv2.minMaxLoc(result)
+    return max_val, (x0 + max_loc[0], y0 + max_loc[1])
+
+
+def find_template(screen_gray: np.ndarray, template_name: str, threshold: float = MATCH_THRESHOLD, return_bounds: bool = False) -> tuple[int, int] | tuple[int, int, int, int] | None:
+    """
+    Find a template image on a grayscale screen (as returned by take_screenshot).
+    Returns (x, y) center coordinates if found, None otherwise.
+    If return_bounds=True, returns (x, y, width, height) of top-left corner + size.
+    """
+    template = load_template(template_name)
+    if template is None:
+        return None
+    _, _, h, w = template
+    
+    # Try where it was last seen first; only search everything on a miss
+    match = _match_last_location(screen_gray, template_name, template)
+    if match is None or match[0] < threshold:
+        match = _match_pyramid(screen_gray, template, threshold)
+    max_val, max_loc = match
     
     log_info(f"Template '{template_name}': {max_val:.3f} (threshold: {threshold})")
     
     if max_val >= threshold:
-        h, w = template.shape[:2]
+        _remember_location(template_name, max_loc)
         if return_bounds:
             return (max_loc[0], max_loc[1], w, h)
         center_x = max_loc[0] + w // 2
@@ -108,25 +288,58 @@ def find_template(screen: np.ndarray, template_name: str, threshold: float = MAT
     return None
 
 
+def find_templates(screen_gray: np.ndarray, template_names: list[str], threshold: float = MATCH_THRESHOLD, return_bounds: bool = False, first_match_wins: bool = False) -> dict[str, tuple[int, int] | tuple[int, int, int, int] | None]:
+    """
+    Match several templates against one grayscale screenshot.
+    The screen's pyrDown is built once and shared.
+    If first_match_wins=True, names are taken as priority order: once a
+    template matches, lower-priority ones are skipped and reported as None.
+    Returns {template_name: result of find_template}.
+    """
+    results = dict.fromkeys(template_names)
+    for name in template_names:
+        results[name] = find_template(screen_gray, name, threshold, return_bounds)
+        if first_match_wins and results[name] is not None:
+            break
+    return results
+
+
+def _x_display() -> Display:
+    """Return the shared X connection, opening it on first use."""
+    global _DISPLAY
+    if _DISPLAY is None:
+        _DISPLAY = Display()
+    return _DISPLAY
+
+
+def _fake_input(event_type: int, detail: int = 0, x: int = 0, y: int = 0):
+    """Send one XTEST event and wait until the server has processed it."""
+    display = _x_display()
+    xtest.fake_input(display, event_type, detail, x=x, y=y)
+    display.sync()
+
+
 def get_mouse_position() -> tuple[int, int]:
     """Get current mouse position."""
     try:
-        result = subprocess.run(
-            ['xdotool', 'getmouselocation'],
-            capture_output=True, text=True
-        )
-        # Parse "x:123 y:456 screen:0 window:789"
-        parts = result.stdout.split()
-        x = int(parts[0].split(':')[1])
-        y = int(parts[1].split(':')[1])
-        return (x, y)
+        pointer = _x_display().screen().root.query_pointer()
+        return (pointer.root_x, pointer.root_y)
     except Exception:
         return (960, 540)  # Default to center
 
 
-def bezier_curve(t: float, p0: float, p1: float, p2: float, p3: float) -> float:
-    """Calculate point on cubic bezier curve."""
-    return (1-t)**3 * p0 + 3*(1-t)**2 * t * p1 + 3*(1-t) * t**2 * p2 + t**3 * p3
+def move_mouse(x: int, y: int):
+    """Warp the pointer to screen coordinates."""
+    _fake_input(X.MotionNotify, x=int(x), y=int(y))
+
+
+def bezier_curve(t: float | np.ndarray, p0: float, p1: float, p2: float, p3: float) -> float | np.ndarray:
+    """Calculate point(s) on cubic bezier curve (t may be an array of positions)."""
+    # Expanded once so (1-t)^2 and t^2 are shared instead of re-powered per term
+    u = 1 - t
+    uu = u * u
+    tt = t * t
+    return uu * u * p0 + 3 * uu * t * p1 + 3 * u * tt * p2 + tt * t * p3
 
 
 def human_move_mouse(target_x: int, target_y: int):
@@ -144,26 +357,27 @@ def human_move_mouse(target_x: int, target_y: int):
     distance = ((target_x - start_x)**2 + (target_y - start_y)**2)**0.5
     steps = max(10, int(distance / 15))
     
-    for i in range(steps + 1):
-        t = i / steps
-        # Add slight speed variation (slower at start and end)
-        t = t * t * (3 - 2 * t)  # Smoothstep
-        
-        x = int(bezier_curve(t, start_x, cp1_x, cp2_x, target_x))
-        y = int(bezier_curve(t, start_y, cp1_y, cp2_y, target_y))
-        
-        subprocess.run(['xdotool', 'mousemove', str(x), str(y)], check=False)
+    # Whole path in one vectorized pass
+    t = np.linspace(0.0, 1.0, steps + 1)
+    # Add slight speed variation (slower at start and end)
+    t = t * t * (3 - 2 * t)  # Smoothstep
+    xs = bezier_curve(t, start_x, cp1_x, cp2_x, target_x).astype(int)
+    ys = bezier_curve(t, start_y, cp1_y, cp2_y, target_y).astype(int)
+    
+    for x, y in zip(xs, ys):
+        move_mouse(x, y)
         time.sleep(random.uniform(0.005, 0.015))
     
     # Final position (ensure we hit the target)
-    subprocess.run(['xdotool', 'mousemove', str(target_x), str(target_y)], check=False)
+    move_mouse(target_x, target_y)
 
 
 def click_at(x: int, y: int):
     """Click at screen coordinates with human-like movement."""
     human_move_mouse(x, y)
     time.sleep(random.uniform(0.05, 0.15))  # Small pause before click
-    subprocess.run(['xdotool', 'click', '1'], check=False)
+    _fake_input(X.ButtonPress, 1)
+    _fake_input(X.ButtonRelease, 1)
     time.sleep(random.uniform(0.1, 0.3))
 
 
@@ -178,15 +392,29 @@ def click_random_within(x: int, y: int, width: int, height: int):
 
 
 def type_text(text: str):
-    """Type text with human-like delays between keystrokes."""
-    for char in text:
-        subprocess.run(['xdotool', 'type', '--', char], check=False)
-        time.sleep(random.uniform(0.05, 0.15))  # Random delay per keystroke
+    """
+    Type text with human-like delays between keystrokes.
+    Sent in random-length chunks of 2-5 characters, one xdotool call each
+    with its own per-key --delay, so rhythm still varies without a fork per key.
+    """
+    pos = 0
+    while pos < len(text):
+        chunk = text[pos:pos + random.randint(2, 5)]
+        pos += len(chunk)
+        delay_ms = random.randint(50, 150)  # Random delay per keystroke
+        subprocess.run(['xdotool', 'type', '--delay', str(delay_ms), '--', chunk], stdout=subprocess.DEVNULL, check=False)
+        time.sleep(random.uniform(0.05, 0.15))  # Pause between chunks
 
 
 def press_key(key: str):
-    """Press a keyboard key."""
-    subprocess.run(['xdotool', 'key', key], check=False)
+    """Press a keyboard key by X keysym name (e.g. "Return")."""
+    keycode = _x_display().keysym_to_keycode(XK.string_to_keysym(key))
+    if keycode:
+        _fake_input(X.KeyPress, keycode)
+        _fake_input(X.KeyRelease, keycode)
+    else:
+        # Not in the current keymap - let xdotool remap a spare keycode for it
+        subprocess.run(['xdotool', 'key', key], stdout=subprocess.DEVNULL, check=False)
     time.sleep(random.uniform(0.1, 0.2))
 
 
@@ -197,17 +425,24 @@ def wait_and_click(template_name: str, timeout: float = 30, step_name: str = "")
     """
     log_step(f"{step_name}: Looking for '{template_name}'...")
     
+    # Last frame that matched nothing - while the screen stays pixel-identical
+    # the result can't change, so matching is skipped until something redraws
+    last_miss = None
     elapsed = 0.0
+    interval = POLL_INTERVAL_MIN
     while elapsed < timeout:
         screen = take_screenshot()
         if screen is not None:
-            coords = find_template(screen, template_name)
-            if coords:
-                log_info(f"Found at ({coords[0]}, {coords[1]}) - clicking")
-                click_at(coords[0], coords[1])
-                return True
-        time.sleep(POLL_INTERVAL)
-        elapsed += POLL_INTERVAL
+            if last_miss is None or not np.array_equal(screen, last_miss):
+                coords = find_template(screen, template_name)
+                if coords:
+                    log_info(f"Found at ({coords[0]}, {coords[1]}) - clicking")
+                    click_at(coords[0], coords[1])
+                    return True
+                last_miss = screen
+        time.sleep(interval)
+        elapsed += interval
+        interval = min(POLL_INTERVAL_MAX, interval * POLL_BACKOFF)
     
     log_warn(f"Timeout waiting for '{template_name}'")
     return False
@@ -225,11 +460,13 @@ def wait_for_window(window_name: str, timeout: float = 60) -> str | None:
     """Wait for a window to appear and return its ID."""
     log_info(f"Waiting for window: {window_name} (timeout: {timeout}s)")
     elapsed = 0.0
+    interval = POLL_INTERVAL_MIN
     while elapsed < timeout:
         try:
             result = subprocess.run(
                 ['xdotool', 'search', '--name', window_name],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True
             )
             if result.returncode == 0 and result.stdout.strip():
@@ -238,8 +475,9 @@ def wait_for_window(window_name: str, timeout: float = 60) -> str | None:
                 return window_id
         except Exception:
             pass
-        time.sleep(POLL_INTERVAL)
-        elapsed += POLL_INTERVAL
+        time.sleep(interval)
+        elapsed += interval
+        interval = min(POLL_INTERVAL_MAX, interval * POLL_BACKOFF)
     
     log_error(f"Timeout waiting for window: {window_name}")
     return None
@@ -276,10 +514,13 @@ def main():
     log_info(f"Account: {CONFIG['username']}")
     log_info(f"Character: {CONFIG['characterName']}")
     
+    # Decode templates now rather than mid-flow between UI interactions
+    preload_templates()
+    
     # Check if RuneLite is already running
     result = subprocess.run(
         ['xdotool', 'search', '--name', 'RuneLite'],
-        capture_output=True, text=True
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
     )
     if result.returncode == 0 and result.stdout.strip():
         log_info("RuneLite is already running - nothing to do")
@@ -301,8 +542,14 @@ def main():
     # =========================================
     log_step("Step 1: Checking for disclaimer...")
     
+    # One screenshot answers both branches: the disclaimer (full login) and the
+    # select account button (persisted session, used in Step 2 below)
+    step1_found = {}
     screen = take_screenshot()
-    need_login = screen is not None and find_template(screen, "i_understand_button.png") is not None
+    if screen is not None:
+        # The disclaimer wins: its branch never needs the select account button
+        step1_found = find_templates(screen, ["i_understand_button.png", "select_account_button.png"], first_match_wins=True)
+    need_login = step1_found.get("i_understand_button.png") is not None
     
     if need_login:
         log_info("Disclaimer found - need full login flow")
@@ -406,13 +653,9 @@ def main():
             # Wait for code entry screen
             time.sleep(random.uniform(2.0, 2.3))
             
-            # Generate TOTP code using oathtool
+            # Generate TOTP code in-process (base32 secret; spaces/case ignored like oathtool)
             try:
-                result = subprocess.run(
-                    ['oathtool', '--totp', '-b', totp_secret],
-                    capture_output=True, text=True, check=True
-                )
-                totp_code = result.stdout.strip()
+                totp_code = pyotp.TOTP(totp_secret.replace(' ', '').upper()).now()
                 log_info(f"Generated TOTP code: {totp_code[:2]}****")
                 
                 # Type the code
@@ -421,7 +664,7 @@ def main():
                 press_key("Return")
                 log_info("TOTP code submitted")
                 time.sleep(3)
-            except subprocess.CalledProcessError as e:
+            except ValueError as e:  # binascii.Error on a malformed secret
                 log_error(f"Failed to generate TOTP code: {e}")
                 return 1
         else:
@@ -437,15 +680,17 @@ def main():
         time.sleep(random.uniform(0.5, 0.8))
         
         # Save coords so we can click again to minimize menu in Step 5
-        select_account_coords = None
-        screen = take_screenshot()
-        if screen is not None:
-            select_account_coords = find_template(screen, "select_account_button.png")
-            if select_account_coords:
-                log_info(f"Found select account button at {select_account_coords}")
-                click_at(select_account_coords[0], select_account_coords[1])
-            else:
-                log_warn("Could not find select account button")
+        # (reuse the Step 1 match; only re-capture if it wasn't visible then)
+        select_account_coords = step1_found.get("select_account_button.png")
+        if select_account_coords is None:
+            screen = take_screenshot()
+            if screen is not None:
+                select_account_coords = find_template(screen, "select_account_button.png")
+        if select_account_coords:
+            log_info(f"Found select account button at {select_account_coords}")
+            click_at(select_account_coords[0], select_account_coords[1])
+        else:
+            log_warn("Could not find select account button")
         
         # =========================================
         # STEP 3 (persisted): Click user select dropdown
@@ -562,14 +807,14 @@ def main():
             # Get the window ID
             result = subprocess.run(
                 ['xdotool', 'search', '--name', 'RuneLite'],
-                capture_output=True, text=True
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
             )
             window_ids = result.stdout.strip().split('\n')
             if window_ids and window_ids[0]:
                 window_id = window_ids[0]
                 # Move to origin and resize to full screen (1920x1080)
-                subprocess.run(['xdotool', 'windowmove', window_id, '0', '0'], check=False)
-                subprocess.run(['xdotool', 'windowsize', window_id, '1920', '1080'], check=False)
+                subprocess.run(['xdotool', 'windowmove', window_id, '0', '0'], stdout=subprocess.DEVNULL, check=False)
+                subprocess.run(['xdotool', 'windowsize', window_id, '1920', '1080'], stdout=subprocess.DEVNULL, check=False)
                 log_info("RuneLite window resized to 1920x1080")
         except Exception as e:
             log_warn(f"Could not maximize window: {e}")
@@ -17,13 +17,72 @@ import random
 from pathlib import Path
 
 import cv2
+import mss
 import numpy as np
+from Xlib import X, XK
+from Xlib.display import Display
+from Xlib.ext import xtest
 
 # Configuration
 TEMPLATES_DIR = Path(__file__).parent / "templates"
-SCREENSHOT_PATH = "/tmp/screen.png"
 MATCH_THRESHOLD = 0.8
-POLL_INTERVAL = 0.5  # seconds between checks
+# Polls start fast and back off exponentially: UI that appears early is
+# caught within ~50ms while long waits settle at the old 0.5s cadence
+POLL_INTERVAL_MIN = 0.05  # seconds before the first re-check
+POLL_INTERVAL_MAX = 0.5  # cap on seconds between checks
+POLL_BACKOFF = 1.5  # interval growth factor per poll
+
+# Screens RuneLite shows on the way into the game, in the order they appear:
+# (label, template, threshold, settle seconds after clicking, seconds to wait
+# for the next screen once this one is clicked). Any of them may be skipped
+# depending on the account, so they are all watched for at once.
+LAUNCH_SCREENS: list[tuple[str, str, float, float, float]] = [
+    ("License", "license_accept_button.png", MATCH_THRESHOLD, 1, 30),
+    # Lower threshold (0.6) because dynamic username affects matching
+    ("Play", "runelite_play_button.png", 0.6, 5, 18),
+    # In-game lobby ("Welcome to Gielinor"); its "CLICK HERE TO PLAY" button
+    # enters the game world
+    ("Lobby", "lobby_click_to_play.png", 0.7, 3, 0),
+]
+# How long to wait for RuneLite (GPU init, UI load, etc.) to show the first screen
+LAUNCH_TIMEOUT = 50
+
+# Templates drawn inside the RuneLite game client. They are only searched
+# within the client window, which is smaller than the screen (gameSize) and
+# not moved or resized before post_launch runs; anything else, or everything
+# while the window can't be located, is searched across the whole screen.
+_CLIENT_TEMPLATES = {"license_accept_button.png", "lobby_click_to_play.png"}
+
+# Coarse-to-fine matching: a half-resolution pass finds candidates, then
+# only small regions around them are matched at full resolution
+PYRAMID_SLACK = 0.25  # coarse scores may sit this far below the real threshold
+PYRAMID_MIN_SIDE = 32  # thinner templates (single text lines) skip the coarse pass
+PYRAMID_REFINE_MARGIN = 4  # px of slack around each coarse region at full res
+_PYRAMID_KERNEL = np.ones((3, 3), np.uint8)
+
+# Decoded grayscale templates keyed by file name:
+# (template_gray, template_gray_down, h, w), where _down is the pyrDown level
+_TEMPLATE_CACHE: dict[str, tuple[np.ndarray, np.ndarray, int, int]] = {}
+
+# Scratch arrays reused across polls: the screen, the pyrDown of each search
+# region shape, and each template's result map per pass and region shape.
+# Keys include everything that determines the shape, so buffers stay put
+# while several templates and regions are checked on every poll.
+_BUFFERS: dict[tuple, np.ndarray] = {}
+
+# Let matchTemplate spread across cores, leaving one for RuneLite itself
+cv2.setUseOptimized(True)
+cv2.setNumThreads(max(1, (os.cpu_count() or 1) - 1))
+
+# Screen grabber, opened on first screenshot (needs DISPLAY)
+_SCT = None
+
+# RuneLite client window, looked up on first use (see _runelite_window_rect)
+_RUNELITE_WINDOW = None
+
+# X connection used to inject mouse/keyboard input via XTEST, opened on first
+# use and kept for the whole run instead of forking xdotool per action
+_DISPLAY: Display | None = None
 
 
 class Colors:
@@ -56,48 +115,187 @@ def log_debug(msg: str):
     print(f"{Colors.MAGENTA}[POST-LAUNCH]{Colors.NC} {msg}", flush=True)
 
 
+def _buffer(key: tuple, shape: tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+    """Reusable scratch array for `key`, reallocated only when its shape changes."""
+    buf = _BUFFERS.get(key)
+    if buf is None or buf.shape != shape:
+        buf = np.empty(shape, dtype)
+        _BUFFERS[key] = buf
+    return buf
+
+
+def _match(image: np.ndarray, template_gray: np.ndarray, method: int, kind: str) -> np.ndarray:
+    """
+    cv2.matchTemplate writing into a result buffer reused per pass kind,
+    template and image shape. Template arrays live in _TEMPLATE_CACHE for the
+    whole run, so their ids are stable keys.
+    """
+    shape = (image.shape[0] - template_gray.shape[0] + 1, image.shape[1] - template_gray.shape[1] + 1)
+    key = (kind, id(template_gray), image.shape)
+    return cv2.matchTemplate(image, template_gray, method, result=_buffer(key, shape, np.float32))
+
+
 def take_screenshot() -> np.ndarray | None:
-    """Capture the current screen."""
+    """
+    Capture the current screen as grayscale, straight from X into memory.
+    The returned array is a shared buffer that the next call overwrites.
+    """
+    global _SCT
     try:
-        result = subprocess.run(
-            ['import', '-window', 'root', SCREENSHOT_PATH],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            log_error(f"Screenshot failed: {result.stderr}")
-            return None
-        img = cv2.imread(SCREENSHOT_PATH)
-        if img is None:
-            log_error(f"Failed to load screenshot from {SCREENSHOT_PATH}")
-        return img
+        if _SCT is None:
+            _SCT = mss.mss()
+        shot = _SCT.grab(_SCT.monitors[1])
+        # mss hands back raw BGRA pixels; convert straight to the grayscale
+        # that matching uses instead of going through a BGR copy
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        screen = _buffer(('screen',), (shot.height, shot.width))
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY, dst=screen)
     except Exception as e:
         log_error(f"Failed to take screenshot: {e}")
         return None
 
 
-def find_template(screen: np.ndarray, template_name: str, threshold: float = MATCH_THRESHOLD, return_bounds: bool = False) -> tuple[int, int] | tuple[int, int, int, int] | None:
+def load_template(template_name: str) -> tuple[np.ndarray, np.ndarray, int, int] | None:
+    """
+    Load a template as grayscale, memoized by name.
+    Returns (template_gray, template_gray_down, height, width), where _down is
+    the half-resolution pyramid level, or None if the file is missing/unreadable.
+    """
+    cached = _TEMPLATE_CACHE.get(template_name)
+    if cached is not None:
+        return cached
+    
+    # Only the grayscale version is ever matched against, so skip the BGR decode
+    template_gray = cv2.imread(str(TEMPLATES_DIR / template_name), cv2.IMREAD_GRAYSCALE)
+    if template_gray is None:
+        return None
+    
+    h, w = template_gray.shape[:2]
+    _TEMPLATE_CACHE[template_name] = (template_gray, cv2.pyrDown(template_gray), h, w)
+    return _TEMPLATE_CACHE[template_name]
+
+
+def preload_templates():
+    """Decode every template up front so the polling loops never touch disk."""
+    for template_path in sorted(TEMPLATES_DIR.glob("*.png")):
+        load_template(template_path.name)
+    log_debug(f"Preloaded {len(_TEMPLATE_CACHE)} templates")
+
+
+def _runelite_window_rect() -> tuple[int, int, int, int] | None:
+    """
+    Screen bounds (x0, y0, x1, y1) of the RuneLite client window, or None if
+    it can't be found. The window is looked up once; its position is re-read
+    on every call in case it moves.
     """
-    Find a template image on screen.
+    global _RUNELITE_WINDOW
+    try:
+        display = _x_display()
+        root = display.screen().root
+        if _RUNELITE_WINDOW is None:
+            result = subprocess.run(
+                ['xdotool', 'search', '--onlyvisible', '--name', 'RuneLite'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            )
+            windows = [display.create_resource_object('window', int(wid)) for wid in result.stdout.split()]
+            if not windows:
+                return None
+            # Java creates several helper windows with the same title; the client is the largest
+            _RUNELITE_WINDOW = max(windows, key=lambda win: (g := win.get_geometry()).width * g.height)
+        
+        geom = _RUNELITE_WINDOW.get_geometry()
+        origin = root.translate_coords(_RUNELITE_WINDOW, 0, 0)
+        return (origin.x, origin.y, origin.x + geom.width, origin.y + geom.height)
+    except Exception:
+        # Window gone (e.g. client restarted) - look it up again next time
+        _RUNELITE_WINDOW = None
+        return None
+
+
+def _search_region(screen_gray: np.ndarray, template_name: str, h: int, w: int) -> tuple[int, int, int, int]:
+    """Pixel bounds (x0, y0, x1, y1) of the screen area to search for a template."""
+    screen_h, screen_w = screen_gray.shape[:2]
+    rect = _runelite_window_rect() if template_name in _CLIENT_TEMPLATES else None
+    if rect is None:
+        return (0, 0, screen_w, screen_h)
+    
+    x0, y0 = max(0, rect[0]), max(0, rect[1])
+    x1, y1 = min(screen_w, rect[2]), min(screen_h, rect[3])
+    # A region smaller than the template can't contain it; fall back to the full screen
+    if x1 - x0 < w or y1 - y0 < h:
+        return (0, 0, screen_w, screen_h)
+    return (x0, y0, x1, y1)
+
+
+def _match_full(screen_gray: np.ndarray, template_gray: np.ndarray) -> tuple[float, tuple[int, int]]:
+    """Best TM_CCOEFF_NORMED score and top-left location over the whole region."""
+    result = _match(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED, 'full')
+    _, max_val, _, max_loc = cv2.minMaxLoc(result)
+    return max_val, max_loc
+
+
+def find_template_pyramid(screen_gray: np.ndarray, template: tuple, threshold: float) -> tuple[float, tuple[int, int]]:
+    """
+    Best TM_CCOEFF_NORMED score and top-left location, searched coarse-to-fine.
+    The half-resolution pass covers 1/4 of the pixels; every blob above
+    (threshold - PYRAMID_SLACK) is then re-matched exactly at full resolution,
+    in a window only PYRAMID_REFINE_MARGIN px larger than the template.
+    If nothing clears the coarse cut, the coarse best score is returned.
+    """
+    template_gray, template_gray_down, h, w = template
+    screen_h, screen_w = screen_gray.shape[:2]
+    if min(h, w) < PYRAMID_MIN_SIDE or screen_h < 2 * h or screen_w < 2 * w:
+        return _match_full(screen_gray, template_gray)
+    
+    down_shape = ((screen_h + 1) // 2, (screen_w + 1) // 2)
+    screen_down = cv2.pyrDown(screen_gray, dst=_buffer(('screen_down', screen_gray.shape), down_shape))
+    coarse = _match(screen_down, template_gray_down, cv2.TM_CCOEFF_NORMED, 'coarse')
+    
+    # Close small gaps so neighbouring hits collapse into one region
+    hits = (coarse >= threshold - PYRAMID_SLACK).astype(np.uint8)
+    hits = cv2.morphologyEx(hits, cv2.MORPH_CLOSE, _PYRAMID_KERNEL)
+    count, _, stats, _ = cv2.connectedComponentsWithStats(hits)
+    
+    if count <= 1:
+        _, coarse_val, _, coarse_loc = cv2.minMaxLoc(coarse)
+        return coarse_val, (coarse_loc[0] * 2, coarse_loc[1] * 2)
+    
+    margin = PYRAMID_REFINE_MARGIN
+    best_val, best_loc = -1.0, (0, 0)
+    for x, y, bw, bh, _ in stats[1:]:
+        # Range of full-res top-left positions to test, clamped to the screen
+        x1 = min(screen_w - w, 2 * (x + bw - 1) + margin)
+        y1 = min(screen_h - h, 2 * (y + bh - 1) + margin)
+        x0 = min(max(0, 2 * x - margin), x1)
+        y0 = min(max(0, 2 * y - margin), y1)
+        roi = screen_gray[y0:y1 + h, x0:x1 + w]
+        
+        result = cv2.matchTemplate(roi, template_gray, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        if max_val > best_val:
+            best_val, best_loc = max_val, (x0 + max_loc[0], y0 + max_loc[1])
+    
+    return best_val, best_loc
+
+
+def find_template(screen_gray: np.ndarray, template_name: str, threshold: float = MATCH_THRESHOLD, return_bounds: bool = False) -> tuple[int, int] | tuple[int, int, int, int] | None:
+    """
+    Find a template image on a grayscale screen.
     Returns (x, y) center coordinates if found, None otherwise.
     If return_bounds=True, returns (x, y, width, height) of top-left corner + size.
     """
-    template_path = TEMPLATES_DIR / template_name
-    template = cv2.imread(str(template_path))
+    template = load_template(template_name)
     if template is None:
         return None
+    h, w = template[2:]
     
-    # Convert to grayscale for robust matching
-    screen_gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
-    template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
-    
-    result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
-    _, max_val, _, max_loc = cv2.minMaxLoc(result)
+    x0, y0, x1, y1 = _search_region(screen_gray, template_name, h, w)
+    max_val, max_loc = find_template_pyramid(screen_gray[y0:y1, x0:x1], template, threshold)
+    max_loc = (max_loc[0] + x0, max_loc[1] + y0)
     
     log_debug(f"Template '{template_name}': {max_val:.3f} (threshold: {threshold})")
     
     if max_val >= threshold:
-        h, w = template.shape[:2]
         if return_bounds:
             return (max_loc[0], max_loc[1], w, h)
         center_x = max_loc[0] + w // 2
@@ -107,25 +305,41 @@ def find_template(screen: np.ndarray, template_name: str, threshold: float = MAT
     return None
 
 
+def _x_display() -> Display:
+    """Return the shared X connection, opening it on first use."""
+    global _DISPLAY
+    if _DISPLAY is None:
+        _DISPLAY = Display()
+    return _DISPLAY
+
+
+def _fake_input(event_type: int, detail: int = 0, x: int = 0, y: int = 0):
+    """Send one XTEST event and wait until the server has processed it."""
+    display = _x_display()
+    xtest.fake_input(display, event_type, detail, x=x, y=y)
+    display.sync()
+
+
 def get_mouse_position() -> tuple[int, int]:
     """Get current mouse position."""
     try:
-        result = subprocess.run(
-            ['xdotool', 'getmouselocation'],
-            capture_output=True, text=True
-        )
-        # Parse "x:123 y:456 screen:0 window:789"
-        parts = result.stdout.split()
-        x = int(parts[0].split(':')[1])
-        y = int(parts[1].split(':')[1])
-        return (x, y)
+        pointer = _x_display().screen().root.query_pointer()
+        return (pointer.root_x, pointer.root_y)
     except Exception:
         return (960, 540)  # Default to center
 
 
-def bezier_curve(t: float, p0: float, p1: float, p2: float, p3: float) -> float:
-    """Calculate point on cubic bezier curve."""
-    return (1-t)**3 * p0 + 3*(1-t)**2 * t * p1 + 3*(1-t) * t**2 * p2 + t**3 * p3
+def move_mouse(x: int, y: int):
+    """Warp the pointer to screen coordinates."""
+    _fake_input(X.MotionNotify, x=int(x), y=int(y))
+
+
+def bezier_curve(t: float | np.ndarray, p0: float, p1: float, p2: float, p3: float) -> float | np.ndarray:
+    """Calculate point(s) on cubic bezier curve (t may be an array of positions)."""
+    u = 1 - t
+    uu = u * u
+    tt = t * t
+    return uu * u * p0 + 3 * uu * t * p1 + 3 * u * tt * p2 + tt * t * p3
 
 
 def human_move_mouse(target_x: int, target_y: int):
@@ -142,24 +356,25 @@ def human_move_mouse(target_x: int, target_y: int):
     distance = ((target_x - start_x)**2 + (target_y - start_y)**2)**0.5
     steps = max(10, int(distance / 15))
     
-    for i in range(steps + 1):
-        t = i / steps
-        t = t * t * (3 - 2 * t)  # Smoothstep
-        
-        x = int(bezier_curve(t, start_x, cp1_x, cp2_x, target_x))
-        y = int(bezier_curve(t, start_y, cp1_y, cp2_y, target_y))
-        
-        subprocess.run(['xdotool', 'mousemove', str(x), str(y)], check=False)
+    # Whole path in one vectorized pass
+    t = np.linspace(0.0, 1.0, steps + 1)
+    t = t * t * (3 - 2 * t)  # Smoothstep
+    xs = bezier_curve(t, start_x, cp1_x, cp2_x, target_x).astype(np.int32)
+    ys = bezier_curve(t, start_y, cp1_y, cp2_y, target_y).astype(np.int32)
+    
+    for x, y in zip(xs, ys):
+        move_mouse(x, y)
         time.sleep(random.uniform(0.005, 0.015))
     
-    subprocess.run(['xdotool', 'mousemove', str(target_x), str(target_y)], check=False)
+    move_mouse(target_x, target_y)
 
 
 def click_at(x: int, y: int):
     """Click at screen coordinates with human-like movement."""
     human_move_mouse(x, y)
     time.sleep(random.uniform(0.05, 0.15))
-    subprocess.run(['xdotool', 'click', '1'], check=False)
+    _fake_input(X.ButtonPress, 1)
+    _fake_input(X.ButtonRelease, 1)
     time.sleep(random.uniform(0.1, 0.3))
 
 
@@ -173,15 +388,29 @@ def click_random_within(x: int, y: int, width: int, height: int):
 
 
 def type_text(text: str):
-    """Type text with human-like delays between keystrokes."""
-    for char in text:
-        subprocess.run(['xdotool', 'type', '--', char], check=False)
-        time.sleep(random.uniform(0.05, 0.15))
+    """
+    Type text with human-like delays between keystrokes.
+    Sent in random-length chunks of 2-5 characters, one xdotool call each
+    with its own per-key --delay, so rhythm still varies without a fork per key.
+    """
+    pos = 0
+    while pos < len(text):
+        chunk = text[pos:pos + random.randint(2, 5)]
+        pos += len(chunk)
+        delay_ms = random.randint(50, 150)
+        subprocess.run(['xdotool', 'type', '--delay', str(delay_ms), '--', chunk], check=False)
+        time.sleep(random.uniform(0.05, 0.15))  # Pause between chunks
 
 
 def press_key(key: str):
-    """Press a keyboard key."""
-    subprocess.run(['xdotool', 'key', key], check=False)
+    """Press a keyboard key by X keysym name (e.g. "Return")."""
+    keycode = _x_display().keysym_to_keycode(XK.string_to_keysym(key))
+    if keycode:
+        _fake_input(X.KeyPress, keycode)
+        _fake_input(X.KeyRelease, keycode)
+    else:
+        # Not in the current keymap - let xdotool remap a spare keycode for it
+        subprocess.run(['xdotool', 'key', key], check=False)
     time.sleep(random.uniform(0.1, 0.2))
 
 
@@ -193,6 +422,7 @@ def wait_and_click(template_name: str, timeout: float = 30, step_name: str = "",
     log_step(f"{step_name}: Looking for '{template_name}' (threshold={threshold})...")
     
     elapsed = 0.0
+    interval = POLL_INTERVAL_MIN
     while elapsed < timeout:
         screen = take_screenshot()
         if screen is not None:
@@ -201,13 +431,66 @@ def wait_and_click(template_name: str, timeout: float = 30, step_name: str = "",
                 log_info(f"Found at ({coords[0]}, {coords[1]}) - clicking")
                 click_at(coords[0], coords[1])
                 return True
-        time.sleep(POLL_INTERVAL)
-        elapsed += POLL_INTERVAL
+        time.sleep(interval)
+        elapsed += interval
+        interval = min(POLL_INTERVAL_MAX, interval * POLL_BACKOFF)
     
     log_warn(f"Timeout waiting for '{template_name}'")
     return False
 
 
+def handle_launch_screens() -> list[str]:
+    """
+    Click through LAUNCH_SCREENS as they show up, instead of waiting a fixed
+    time for each. Every poll checks all screens not yet passed; clicking one
+    also drops the screens before it, since those can't come back.
+    The next expected screen is clicked as soon as it matches. A later one
+    (which would skip earlier screens for good) must match on two consecutive
+    polls first, so a one-frame false hit on a splash or loading frame can't
+    skip e.g. the license dialog.
+    Returns the labels of screens that were never seen.
+    """
+    remaining = list(LAUNCH_SCREENS)
+    missed: list[str] = []
+    deadline = time.monotonic() + LAUNCH_TIMEOUT
+    interval = POLL_INTERVAL_MIN
+    unconfirmed = None  # index in remaining of a later screen matched on the last poll
+    while remaining and time.monotonic() < deadline:
+        screen = take_screenshot()
+        clicked = None
+        if screen is not None:
+            for i, (label, template_name, threshold, _, _) in enumerate(remaining):
+                coords = find_template(screen, template_name, threshold=threshold)
+                if not coords:
+                    continue
+                if i > 0 and unconfirmed != i:
+                    log_info(f"{label} screen seen - confirming before skipping earlier screens")
+                    unconfirmed = i
+                    break
+                log_info(f"{label} screen found at ({coords[0]}, {coords[1]}) - clicking")
+                click_at(coords[0], coords[1])
+                clicked = i
+                break
+            else:
+                unconfirmed = None
+        
+        if clicked is None:
+            time.sleep(interval)
+            interval = min(POLL_INTERVAL_MAX, interval * POLL_BACKOFF)
+            continue
+        
+        _, _, _, settle, next_timeout = remaining[clicked]
+        missed.extend(label for label, *_ in remaining[:clicked])
+        del remaining[:clicked + 1]
+        unconfirmed = None
+        time.sleep(settle)
+        deadline = time.monotonic() + next_timeout
+        interval = POLL_INTERVAL_MIN
+    
+    missed.extend(label for label, *_ in remaining)
+    return missed
+
+
 def check_template_present(template_name: str) -> bool:
     """Check if a template is currently visible (no waiting)."""
     screen = take_screenshot()
@@ -226,58 +509,19 @@ def main():
     character_name = os.environ.get('CHARACTER_NAME', '')
     log_info(f"CHARACTER_NAME: {character_name if character_name else '<not set>'}")
     
-    # Wait for RuneLite to fully render (GPU init, UI load, etc.)
-    log_step("Waiting 20s for RuneLite to fully initialize...")
-    time.sleep(20)
+    preload_templates()
     
     # =========================================
-    # Phase 1: Handle license agreement (if present) - ONE attempt only
+    # Phases 1-2.5: License agreement, Play button, in-game lobby
     # =========================================
-    log_step("Phase 1: Checking for license agreement screen...")
+    log_step("Phases 1-2.5: Waiting for license, Play button, or lobby screen...")
     
-    screen = take_screenshot()
-    if screen is not None:
-        coords = find_template(screen, "license_accept_button.png")
-        if coords:
-            log_info(f"License button found at ({coords[0]}, {coords[1]}) - clicking")
-            click_at(coords[0], coords[1])
-            time.sleep(1)
-        else:
-            log_info("No license screen visible (not needed)")
-    
-    # =========================================
-    # Phase 2: Click Play button
-    # =========================================
-    log_step("Phase 2: Looking for Play button...")
-    
-    # Lower threshold (0.6) because dynamic username affects matching
-    if wait_and_click("runelite_play_button.png", timeout=30, step_name="Play", threshold=0.6):
-        log_info("Play button clicked!")
-        time.sleep(5)
-    else:
+    missed = handle_launch_screens()
+    if "License" in missed:
+        log_info("No license screen visible (not needed)")
+    if "Play" in missed:
         log_warn("Play button not found on screen")
-    
-    # =========================================
-    # Phase 2.5: Handle in-game lobby screen ("Welcome to Gielinor")
-    # This appears AFTER the RuneLite play button, BEFORE world loads
-    # The "CLICK HERE TO PLAY" button enters the game world
-    # =========================================
-    log_step("Phase 2.5: Checking for in-game lobby screen...")
-    
-    time.sleep(3)  # Wait for lobby to potentially appear
-    
-    # Try a few times - the lobby screen may take a moment to appear
-    for attempt in range(6):  # 6 attempts over ~15 seconds
-        screen = take_screenshot()
-        if screen is not None:
-            coords = find_template(screen, "lobby_click_to_play.png", threshold=0.7)
-            if coords:
-                log_info(f"Lobby screen found at ({coords[0]}, {coords[1]}) - clicking")
-                click_at(coords[0], coords[1])
-                time.sleep(3)
-                break
-        time.sleep(2.5)
-    else:
+    if "Lobby" in missed:
         log_info("No lobby screen detected (may not be needed for this account)")
     
     # =========================================